@@ -0,0 +1,175 @@
+"""
+Columnar transfer module using Apache Arrow (connectorx source, ADBC or
+pandas destination)
+"""
+import importlib.util
+from sqlalchemy import Table, select, func
+from sqlalchemy.engine import make_url
+from typing import Iterator, Optional
+
+from db_connector import DatabaseConnector
+
+
+class ArrowTransfer:
+    """Moves table data as Arrow tables instead of Python row objects"""
+    
+    def __init__(self, source_connector: DatabaseConnector, dest_connector: DatabaseConnector,
+                 source_table: Table, dest_table: Table, window_rows: int = 1000000,
+                 partitions: int = 4):
+        """
+        Initialize Arrow transfer
+        
+        Args:
+            source_connector: Connected source database connector
+            dest_connector: Connected destination database connector
+            source_table: Source table object
+            dest_table: Destination table object
+            window_rows: Rows read per connectorx call
+            partitions: Parallel connectorx partitions per window
+        """
+        try:
+            import connectorx
+        except ImportError:
+            connectorx = None
+        
+        # connectorx's arrow return type needs pyarrow, which is never used directly
+        if connectorx is None or importlib.util.find_spec('pyarrow') is None:
+            raise RuntimeError(
+                "migration.engine 'arrow' requires connectorx and pyarrow "
+                "(pip install connectorx pyarrow)"
+            )
+        
+        self.connectorx = connectorx
+        self.source_connector = source_connector
+        self.dest_connector = dest_connector
+        self.source_table = source_table
+        self.dest_table = dest_table
+        self.window_rows = window_rows
+        self.partitions = partitions
+    
+    def _source_url(self) -> str:
+        """Build the connectorx URL (scheme without the SQLAlchemy driver)"""
+        url = make_url(self.source_connector.get_connection_string())
+        query = {}
+        if url.query.get('trusted_connection') == 'yes':
+            query['trusted_connection'] = 'true'
+        url = url.set(drivername=url.get_backend_name(), query=query)
+        return url.render_as_string(hide_password=False)
+    
+    def _partition_key(self):
+        """Return the single integer primary key column, or None"""
+        primary_keys = [col for col in self.source_table.columns if col.primary_key]
+        if len(primary_keys) != 1:
+            return None
+        
+        try:
+            if primary_keys[0].type.python_type is int:
+                return primary_keys[0]
+        except NotImplementedError:
+            pass
+        return None
+    
+    def _compile(self, query) -> str:
+        """Render a SELECT as literal SQL for connectorx"""
+        dialect = self.source_connector.get_engine().dialect
+        return str(query.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    
+    def read_windows(self) -> Iterator:
+        """
+        Read the source table as a sequence of Arrow tables
+        
+        With a single integer primary key the table is read in windows of
+        window_rows rows, each split into parallel connectorx partitions.
+        Window boundaries come from the key index (the key window_rows rows
+        further on), so sparse or gapped keys never produce empty windows.
+        Otherwise the whole table is read in one call.
+        
+        Yields:
+            pyarrow.Table per window
+        """
+        source_url = self._source_url()
+        pk = self._partition_key()
+        
+        if pk is None:
+            print("⚠ No single integer primary key - reading the source in one piece")
+            yield self.connectorx.read_sql(
+                source_url,
+                self._compile(select(self.source_table)),
+                return_type='arrow'
+            )
+            return
+        
+        with self.source_connector.get_engine().connect() as conn:
+            lower = conn.execute(select(func.min(pk))).scalar()
+        
+        while lower is not None:
+            # First key of the next window, or None if this is the last one
+            with self.source_connector.get_engine().connect() as conn:
+                upper = conn.execute(
+                    select(pk).where(pk >= lower).order_by(pk).offset(self.window_rows).limit(1)
+                ).scalar()
+            
+            query = select(self.source_table).where(pk >= lower)
+            if upper is not None:
+                query = query.where(pk < upper)
+            
+            yield self.connectorx.read_sql(
+                source_url,
+                self._compile(query),
+                return_type='arrow',
+                partition_on=pk.name,
+                partition_num=self.partitions
+            )
+            lower = upper
+    
+    def write(self, arrow_table):
+        """
+        Append an Arrow table to the destination
+        
+        PostgreSQL uses ADBC bulk ingest (COPY under the hood); other
+        dialects go through pandas to_sql with multi-row INSERTs.
+        
+        Args:
+            arrow_table: pyarrow.Table with the source columns
+        """
+        dest_engine = self.dest_connector.get_engine()
+        
+        if dest_engine.dialect.name == 'postgresql':
+            adbc = self._import_adbc_postgresql()
+            if adbc is not None:
+                url = make_url(self.dest_connector.get_connection_string())
+                uri = url.set(drivername='postgresql').render_as_string(hide_password=False)
+                with adbc.connect(uri) as conn:
+                    with conn.cursor() as cursor:
+                        cursor.adbc_ingest(
+                            self.dest_table.name,
+                            arrow_table,
+                            mode='append',
+                            db_schema_name=self.dest_table.schema
+                        )
+                    conn.commit()
+                return
+        
+        # Multi-row INSERTs bind every value, so stay under SQL Server's
+        # 2100 parameter limit
+        chunksize = self.dest_connector.executemany_page_size
+        if dest_engine.dialect.name == 'mssql':
+            chunksize = max(1, min(chunksize, 2099 // max(1, arrow_table.num_columns)))
+        
+        arrow_table.to_pandas().to_sql(
+            self.dest_table.name,
+            dest_engine,
+            schema=self.dest_table.schema,
+            if_exists='append',
+            index=False,
+            method='multi',
+            chunksize=chunksize
+        )
+    
+    def _import_adbc_postgresql(self) -> Optional[object]:
+        """Return the ADBC PostgreSQL DBAPI module if installed"""
+        try:
+            import adbc_driver_postgresql.dbapi as adbc
+            return adbc
+        except ImportError:
+            return None
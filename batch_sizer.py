@@ -0,0 +1,82 @@
+"""
+Adaptive batch sizing module based on observed insert times
+"""
+from sqlalchemy.exc import DBAPIError
+
+
+class BatchSizer:
+    """Grows or shrinks the batch size depending on how long inserts take"""
+    
+    # Double the batch when an insert finishes faster than this (seconds)
+    GROW_BELOW = 0.5
+    
+    # Halve the batch when an insert takes longer than this (seconds)
+    SHRINK_ABOVE = 5.0
+    
+    # Upper bound on rows per batch
+    MAX_ROWS = 50000
+    
+    # pyodbc / SQL Server limit on parameters per statement
+    MSSQL_MAX_PARAMS = 2100
+    
+    # Error text that means the batch was too large for the server or driver
+    SIZE_ERROR_MARKERS = ('packet', 'too many parameters', 'too many sql variables')
+    
+    def __init__(self, initial_size: int, dialect_name: str, column_count: int,
+                 enabled: bool = True):
+        """
+        Initialize batch sizer
+        
+        Args:
+            initial_size: Starting batch size (the configured batch_size)
+            dialect_name: Destination dialect name
+            column_count: Number of columns per row
+            enabled: If False, the size stays at initial_size
+        """
+        self.size = initial_size
+        self.enabled = enabled
+        
+        self.max_size = self.MAX_ROWS
+        if dialect_name == 'mssql':
+            self.max_size = self.MSSQL_MAX_PARAMS // max(1, column_count)
+        
+        # Never cap below what the user configured
+        self.max_size = max(self.max_size, initial_size)
+    
+    def record(self, rows: int, duration: float):
+        """
+        Adjust the batch size after an insert
+        
+        Args:
+            rows: Rows in the batch that was inserted
+            duration: Time the insert took, in seconds
+        """
+        if not self.enabled:
+            return
+        
+        if duration > self.SHRINK_ABOVE:
+            self.shrink()
+        elif duration < self.GROW_BELOW and rows >= self.size:
+            # Only grow on full batches; the last partial one says nothing
+            self.size = min(self.size * 2, self.max_size)
+    
+    def shrink(self):
+        """Halve the batch size"""
+        if self.enabled:
+            self.size = max(1, self.size // 2)
+    
+    def is_size_error(self, error: Exception) -> bool:
+        """
+        Check whether an insert failed because the batch was too large
+        
+        Args:
+            error: Exception raised by the insert
+        
+        Returns:
+            True if retrying with smaller batches may succeed
+        """
+        if not self.enabled or not isinstance(error, DBAPIError):
+            return False
+        
+        message = str(error.orig).lower()
+        return any(marker in message for marker in self.SIZE_ERROR_MARKERS)
@@ -0,0 +1,202 @@
+"""
+Bulk loading module using dialect-native fast paths
+"""
+import io
+import json
+from datetime import timedelta
+from operator import itemgetter
+from sqlalchemy import Table, insert, text
+from sqlalchemy.types import ARRAY, Time
+from typing import Any, Iterable, List, Mapping, Optional
+
+
+class BulkLoader:
+    """Inserts batches of rows using the fastest path the destination supports"""
+    
+    def __init__(
+        self,
+        table: Table,
+        dialect_name: str,
+        mode: str = 'auto',
+        source_columns: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize bulk loader
+        
+        Args:
+            table: Destination table object
+            dialect_name: Destination dialect name (e.g. 'postgresql')
+            mode: 'auto' to use native bulk paths where available, 'off' to
+                always use parameterized INSERT
+            source_columns: Names of the columns the source rows carry; COPY
+                only lists destination columns found among them so the rest
+                fall back to their defaults
+        """
+        self.table = table
+        self.dialect_name = dialect_name
+        self.columns = [col.name for col in table.columns]
+        if source_columns is not None:
+            source_columns = set(source_columns)
+            self.columns = [name for name in self.columns if name in source_columns]
+        self.insert_stmt = insert(table)
+        self.method = self._select_method(dialect_name, mode)
+        
+        if self.method == 'copy':
+            # Pull every column out of a row mapping in one C-level call
+            getter = itemgetter(*self.columns)
+            self._row_values = getter if len(self.columns) > 1 else lambda row: (getter(row),)
+            
+            # Drivers like PyMySQL return TIME as timedelta, which COPY would
+            # otherwise render as interval text
+            if any(isinstance(table.c[name].type, Time) for name in self.columns):
+                self._formatters = [
+                    _copy_time_value if isinstance(table.c[name].type, Time) else _copy_value
+                    for name in self.columns
+                ]
+            else:
+                self._formatters = None
+    
+    def _select_method(self, dialect_name: str, mode: str) -> str:
+        """
+        Pick the load method for a dialect
+        
+        SQL Server already sends pyodbc parameter arrays via fast_executemany
+        and MySQL's LOAD DATA LOCAL needs local_infile enabled on both client
+        and server, so those keep using INSERT.
+        
+        Returns:
+            'copy' or 'insert'
+        """
+        if mode == 'off' or not self.columns:
+            return 'insert'
+        
+        if dialect_name == 'postgresql':
+            # COPY text format has no array literal conversion here
+            if not any(isinstance(col.type, ARRAY) for col in self.table.columns):
+                return 'copy'
+        
+        return 'insert'
+    
+    def begin_session(self, conn):
+        """
+        Tune a destination connection for a long load
+        
+        On PostgreSQL, commits stop waiting for the WAL flush. A crash can
+        lose the last few commits but never corrupts data, which is fine for
+        a migration that can be re-run.
+        
+        Args:
+            conn: Destination connection
+        """
+        if self.dialect_name == 'postgresql':
+            conn.execute(text("SET synchronous_commit = OFF"))
+            # Commit so a later rollback doesn't undo the SET
+            conn.commit()
+    
+    def end_session(self, conn):
+        """
+        Undo begin_session before the connection returns to the pool
+        
+        Args:
+            conn: Destination connection
+        """
+        if self.dialect_name == 'postgresql':
+            conn.execute(text("RESET synchronous_commit"))
+            conn.commit()
+    
+    def load(self, conn, rows: List[Mapping[str, Any]]):
+        """
+        Insert a batch of rows (the caller commits)
+        
+        Args:
+            conn: SQLAlchemy connection to the destination
+            rows: Row mappings keyed by column name
+        """
+        if self.method == 'copy':
+            self._copy_postgresql(conn, rows)
+        else:
+            conn.execute(self.insert_stmt, rows)
+    
+    def _copy_postgresql(self, conn, rows: List[Mapping[str, Any]]):
+        """Load rows with COPY ... FROM STDIN on the raw psycopg2 cursor"""
+        preparer = conn.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(name) for name in self.columns)
+        sql = f"COPY {preparer.format_table(self.table)} ({columns}) FROM STDIN"
+        
+        buffer = io.StringIO()
+        for row in rows:
+            if self._formatters is None:
+                fields = map(_copy_value, self._row_values(row))
+            else:
+                fields = (
+                    format_value(value)
+                    for format_value, value in zip(self._formatters, self._row_values(row))
+                )
+            buffer.write("\t".join(fields))
+            buffer.write("\n")
+        buffer.seek(0)
+        
+        # Make sure conn.commit() covers the raw cursor's work
+        if not conn.in_transaction():
+            conn.begin()
+        
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(sql, buffer)
+        finally:
+            cursor.close()
+
+
+def _copy_value(value: Any) -> str:
+    """
+    Format a value for PostgreSQL COPY text format
+    
+    Args:
+        value: Python value from the source row
+    
+    Returns:
+        Escaped field text
+    """
+    if value is None:
+        return "\\N"
+    
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input; the backslash itself must be escaped
+        return "\\\\x" + bytes(value).hex()
+    
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    
+    if isinstance(value, timedelta):
+        text = f"{value.total_seconds()} seconds"
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value)
+    else:
+        text = str(value)
+    
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_time_value(value: Any) -> str:
+    """
+    Format a value for a PostgreSQL TIME column in COPY text format
+    
+    Args:
+        value: Python value from the source row
+    
+    Returns:
+        Field text, with timedelta values written as HH:MM:SS.ffffff
+    """
+    if not isinstance(value, timedelta):
+        return _copy_value(value)
+    
+    sign = "-" if value < timedelta(0) else ""
+    seconds, microseconds = divmod(abs(value) // timedelta(microseconds=1), 1000000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}.{microseconds:06d}"
@@ -0,0 +1,166 @@
+"""
+Checkpoint module for resuming interrupted migrations
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from sqlalchemy import Column
+from typing import List, Optional, Sequence, Tuple
+
+
+class Checkpoint:
+    """Persists the last migrated primary key so a restart can skip ahead"""
+    
+    def __init__(self, source_config: dict, dest_config: dict, directory: str = '.'):
+        """
+        Initialize checkpoint
+        
+        The file name covers each side's host, port and database as well as
+        the tables, so runs that reuse table names against other databases
+        (e.g. one per tenant) never pick up each other's checkpoints.
+        
+        Args:
+            source_config: Source database configuration
+            dest_config: Destination database configuration
+            directory: Directory holding the checkpoint file
+        """
+        endpoints = "\n".join(
+            f"{config.get('db_type')}://{config.get('host')}:{config.get('port')}/{config.get('database')}"
+            for config in (source_config, dest_config)
+        )
+        digest = hashlib.sha1(endpoints.encode('utf-8')).hexdigest()[:12]
+        safe_name = re.sub(r'[^\w.-]', '_', f"{source_config['table']}_{dest_config['table']}_{digest}")
+        self.path = os.path.join(directory, f".migrate_checkpoint_{safe_name}.json")
+        self.deferred_key_path = os.path.join(directory, f".migrate_deferred_pk_{safe_name}.json")
+    
+    def exists(self) -> bool:
+        """Check whether a checkpoint has been written"""
+        return os.path.exists(self.path)
+    
+    def load(self, key_columns: Sequence[Column]) -> Optional[Tuple]:
+        """
+        Read the last migrated key
+        
+        Args:
+            key_columns: Primary key columns, in key order
+        
+        Returns:
+            Key values converted back to the columns' Python types, or None
+            if there is no usable checkpoint
+        """
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        
+        values = data.get('last_key')
+        if data.get('columns') != [col.name for col in key_columns] or values is None:
+            return None
+        
+        return tuple(_decode(col, value) for col, value in zip(key_columns, values))
+    
+    def save(self, key_columns: Sequence[Column], last_key: Sequence):
+        """
+        Atomically write the last migrated key
+        
+        Args:
+            key_columns: Primary key columns, in key order
+            last_key: Key values of the last committed row
+        """
+        _write_json(self.path, {
+            'columns': [col.name for col in key_columns],
+            'last_key': list(last_key),
+            'updated_at': datetime.now().isoformat(),
+        })
+    
+    def clear(self):
+        """Remove the checkpoint after a completed migration"""
+        if self.exists():
+            os.remove(self.path)
+    
+    def save_deferred_key(self, columns: Sequence[str]):
+        """
+        Record a primary key this tool left off the destination table
+        
+        The record outlives a failed run, so a later run knows the missing
+        key is one it still owes rather than one the user left out.
+        
+        Args:
+            columns: Primary key column names, in key order
+        """
+        _write_json(self.deferred_key_path, {'columns': list(columns)})
+    
+    def load_deferred_key(self) -> Optional[List[str]]:
+        """
+        Read the primary key recorded by save_deferred_key
+        
+        Returns:
+            Primary key column names, or None if no key is pending
+        """
+        try:
+            with open(self.deferred_key_path, 'r') as f:
+                return json.load(f).get('columns')
+        except FileNotFoundError:
+            return None
+    
+    def clear_deferred_key(self):
+        """Forget the pending primary key once it has been added"""
+        if os.path.exists(self.deferred_key_path):
+            os.remove(self.deferred_key_path)
+
+
+def _write_json(path: str, data: dict):
+    """
+    Atomically replace a JSON file
+    
+    Args:
+        path: File to write
+        data: JSON-serializable content
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def _decode(column: Column, value):
+    """
+    Convert a JSON value back to the column's Python type
+    
+    Args:
+        column: Key column
+        value: Value read from the checkpoint file
+    
+    Returns:
+        Converted value
+    """
+    if value is None:
+        return None
+    
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is time:
+        return time.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return value
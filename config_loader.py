@@ -0,0 +1,75 @@
+"""
+Configuration loading module with a parsed-config cache
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import yaml
+from pathlib import Path
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+CACHE_DIR = Path.home() / '.cache' / 'datamigration'
+
+
+def load_config(config_path: str) -> dict:
+    """
+    Load configuration from a YAML file
+    
+    The parsed result is cached as a pickle keyed by the file's absolute
+    path and modification time, so unchanged configs skip YAML parsing.
+    
+    Args:
+        config_path: Path to configuration file
+    
+    Returns:
+        Configuration dictionary
+    """
+    stat = os.stat(config_path)
+    key = hashlib.sha1(os.path.abspath(config_path).encode('utf-8')).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.{stat.st_mtime_ns}.{stat.st_size}.pkl"
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    
+    _write_cache(cache_file, key, config)
+    return config
+
+
+def _write_cache(cache_file: Path, key: str, config: dict):
+    """
+    Atomically write a parsed config to the cache, removing stale entries
+    
+    Caching is best effort; any failure leaves the cache untouched.
+    
+    Args:
+        cache_file: Target cache file
+        key: Hash of the config path shared by all its cache entries
+        config: Parsed configuration
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        
+        for stale in CACHE_DIR.glob(f"{key}.*.pkl"):
+            stale.unlink(missing_ok=True)
+        
+        # mkstemp creates the file readable only by the owner, which matters
+        # since the config holds database passwords
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
@@ -2,21 +2,26 @@
 Database connection module for multi-database support
 """
 from sqlalchemy import create_engine, text
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine
 from typing import Dict, Any
 
 
 class DatabaseConnector:
     """Manages database connections for different database types"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], executemany_page_size: int = 1000,
+                 async_mode: bool = False):
         """
         Initialize database connector
         
         Args:
             config: Database configuration dictionary
+            executemany_page_size: Rows per multi-row INSERT for bulk inserts
+            async_mode: Use asyncio drivers and create an AsyncEngine
         """
         self.config = config
+        self.executemany_page_size = executemany_page_size
+        self.async_mode = async_mode
         self.engine = None
         
     def get_connection_string(self) -> str:
@@ -33,28 +38,91 @@ class DatabaseConnector:
         username = self.config.get('username')
         password = self.config.get('password')
         
+        async_mode = self.async_mode
+        
         if db_type == 'mysql':
-            return f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
+            driver = 'aiomysql' if async_mode else 'pymysql'
+            return f"mysql+{driver}://{username}:{password}@{host}:{port}/{database}"
         
         elif db_type == 'postgresql':
-            return f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}"
+            driver = 'asyncpg' if async_mode else 'psycopg2'
+            return f"postgresql+{driver}://{username}:{password}@{host}:{port}/{database}"
         
         elif db_type == 'mssql':
+            driver = 'aioodbc' if async_mode else 'pyodbc'
             # For Windows authentication, username and password can be empty
             if username and password:
-                return f"mssql+pyodbc://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
+                return f"mssql+{driver}://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
             else:
-                return f"mssql+pyodbc://{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server&trusted_connection=yes"
+                return f"mssql+{driver}://{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server&trusted_connection=yes"
         
         elif db_type == 'oracle':
-            return f"oracle+cx_oracle://{username}:{password}@{host}:{port}/{database}"
+            # create_async_engine picks the async variant of oracledb
+            driver = 'oracledb' if async_mode else 'cx_oracle'
+            return f"oracle+{driver}://{username}:{password}@{host}:{port}/{database}"
         
         elif db_type == 'sqlite':
-            return f"sqlite:///{database}"
+            driver = '+aiosqlite' if async_mode else ''
+            return f"sqlite{driver}:///{database}"
         
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
     
+    def get_engine_options(self) -> Dict[str, Any]:
+        """
+        Build dialect-specific engine options for fast bulk inserts
+        
+        Returns:
+            Keyword arguments for create_engine
+        """
+        db_type = self.config.get('db_type', '').lower()
+        
+        # Batch executemany() into multi-row INSERT ... VALUES statements
+        options = {'insertmanyvalues_page_size': self.executemany_page_size}
+        
+        if db_type == 'postgresql' and not self.async_mode:
+            options['executemany_mode'] = 'values_plus_batch'
+            options['executemany_batch_page_size'] = 500
+        
+        elif db_type == 'mssql':
+            # Send parameter arrays in one round trip instead of one per row
+            options['fast_executemany'] = True
+        
+        return options
+    
+    def get_pool_options(self) -> Dict[str, Any]:
+        """
+        Build connection pool options
+        
+        Returns:
+            Keyword arguments for create_engine
+        """
+        # SQLite connects to a local file and picks its own pool class
+        # (NullPool/SingletonThreadPool reject sizing arguments)
+        if self.config.get('db_type', '').lower() == 'sqlite':
+            return {}
+        
+        # Small LIFO pool so the long-lived migration connections are
+        # reused instead of reconnecting for every checkout
+        return {
+            'pool_size': 4,
+            'max_overflow': 2,
+            'pool_recycle': 3600,
+            'pool_pre_ping': False,
+            'pool_use_lifo': True,
+        }
+    
+    def _create_engine(self, create):
+        """Create a sync or async engine with the pool and bulk-insert options"""
+        return create(
+            self.get_connection_string(),
+            echo=False,
+            # Room for every statement shape a run uses, so none get recompiled
+            query_cache_size=1200,
+            **self.get_pool_options(),
+            **self.get_engine_options()
+        )
+    
     def connect(self):
         """
         Create and return database engine
@@ -63,13 +131,7 @@ class DatabaseConnector:
             SQLAlchemy engine
         """
         try:
-            connection_string = self.get_connection_string()
-            # Using NullPool to avoid connection pool issues during migration
-            self.engine = create_engine(
-                connection_string,
-                poolclass=NullPool,
-                echo=False
-            )
+            self.engine = self._create_engine(create_engine)
             # Test connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
@@ -77,6 +139,22 @@ class DatabaseConnector:
         except Exception as e:
             raise ConnectionError(f"Failed to connect to database: {str(e)}")
     
+    async def connect_async(self):
+        """
+        Create and return an async database engine (requires async_mode)
+        
+        Returns:
+            SQLAlchemy AsyncEngine
+        """
+        try:
+            self.engine = self._create_engine(create_async_engine)
+            # Test connection
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return self.engine
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to database: {str(e)}")
+    
     def get_engine(self):
         """Get the database engine"""
         if self.engine is None:
@@ -87,3 +165,8 @@ class DatabaseConnector:
         """Close database connection"""
         if self.engine:
             self.engine.dispose()
+    
+    async def close_async(self):
+        """Close async database connection"""
+        if self.engine:
+            await self.engine.dispose()
@@ -2,13 +2,22 @@
 Main data migration script
 """
 import argparse
-import yaml
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from tqdm import tqdm
-from sqlalchemy import select, insert
+from sqlalchemy import MetaData, select, insert, func
 
+from arrow_transfer import ArrowTransfer
+from batch_sizer import BatchSizer
+from bulk_loader import BulkLoader
+from checkpoint import Checkpoint
+from config_loader import load_config
 from db_connector import DatabaseConnector
-from table_manager import TableManager
+from table_manager import NO_PARAMETERS, TableManager, keyset_condition
 
 
 class DataMigration:
@@ -26,13 +35,15 @@ class DataMigration:
         self.dest_connector = None
         self.source_manager = None
         self.dest_manager = None
+        self.deferred_primary_key = None
+        self.source_row_count = None
+        self.resume_key = None
+        self.checkpoint = Checkpoint(self.config['source'], self.config['destination'])
         
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file"""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config
+            return load_config(config_path)
         except Exception as e:
             raise RuntimeError(f"Failed to load config from {config_path}: {str(e)}")
     
@@ -45,12 +56,18 @@ class DataMigration:
         print("\nChecking connections...")
         
         # Connect to source
-        self.source_connector = DatabaseConnector(self.config['source'])
+        self.source_connector = DatabaseConnector(
+            self.config['source'],
+            executemany_page_size=self.config['migration'].get('executemany_page_size', 1000)
+        )
         self.source_connector.connect()
         print("✓ Source connection successful")
         
         # Connect to destination
-        self.dest_connector = DatabaseConnector(self.config['destination'])
+        self.dest_connector = DatabaseConnector(
+            self.config['destination'],
+            executemany_page_size=self.config['migration'].get('executemany_page_size', 1000)
+        )
         self.dest_connector.connect()
         print("✓ Destination connection successful")
         
@@ -68,14 +85,29 @@ class DataMigration:
     def show_row_counts(self):
         """Display row counts for source and destination tables"""
         print()
-        source_count = self.source_manager.get_row_count()
-        dest_count = self.dest_manager.get_row_count()
+        source_count = self.get_source_row_count()
+        dest_count = self.dest_manager.get_row_count(exact=False)
         
         print(f"Source table row count: {source_count:,}")
         print(f"Destination table row count: {dest_count:,}")
         
         return source_count, dest_count
     
+    def get_source_row_count(self) -> int:
+        """
+        Get the approximate source row count, cached for the rest of the run
+        
+        Returns:
+            Estimated row count from the source's statistics catalog
+        """
+        if self.source_row_count is None:
+            self.source_row_count = self.source_manager.get_row_count(exact=False)
+        return self.source_row_count
+    
+    def _source_is_empty(self) -> bool:
+        """Check emptiness, confirming an estimate of 0 since statistics can be stale"""
+        return self.get_source_row_count() == 0 and self.source_manager.get_row_count() == 0
+    
     def prepare_destination_table(self):
         """Prepare destination table (create if needed, truncate if configured)"""
         print("\nPreparing destination table...")
@@ -85,21 +117,101 @@ class DataMigration:
         if source_table is None:
             raise RuntimeError(f"Source table {self.config['source']['table']} does not exist!")
         
+        primary_keys = [col.name for col in source_table.columns if col.primary_key]
+        is_sqlite = self.dest_manager.engine.dialect.name == 'sqlite'
+        
         # Create destination table if needed
         if self.config['migration'].get('create_table_if_missing', True):
             if not self.dest_manager.table_exists():
                 print(f"Creating table {self.config['destination']['table']}...")
-                self.dest_manager.create_table_from_source(source_table)
+                
+                # Load into a table without its primary key and add it afterwards
+                defer_indexes = self.config['migration'].get('defer_indexes', False)
+                if defer_indexes and primary_keys and is_sqlite:
+                    print("⚠ SQLite cannot add a primary key after creation - not deferring it")
+                
+                defer_primary_key = defer_indexes and primary_keys and not is_sqlite
+                self.dest_manager.create_table_from_source(
+                    source_table,
+                    include_primary_key=not defer_primary_key
+                )
+                if defer_primary_key:
+                    self.checkpoint.save_deferred_key(primary_keys)
             else:
                 print(f"✓ Table {self.config['destination']['table']} already exists")
         
-        # Truncate if configured
-        if self.config['migration'].get('truncate_destination', False):
+        # Only a key this tool left out is added back, including one owed by an
+        # earlier deferred load that never finished; a destination created
+        # without a key on purpose stays that way
+        self.deferred_primary_key = None
+        pending_key = self.checkpoint.load_deferred_key()
+        if pending_key is not None:
+            dest_table = self.dest_manager.get_table_object()
+            if dest_table is not None and pending_key == primary_keys and not dest_table.primary_key.columns:
+                print(f"Primary key ({', '.join(primary_keys)}) will be added after loading")
+                self.deferred_primary_key = primary_keys
+            else:
+                self.checkpoint.clear_deferred_key()
+        
+        # Truncate if configured (but never throw away a run being resumed)
+        if self.resume_key is not None:
+            print(f"Resuming from checkpoint {self.checkpoint.path} - not truncating")
+        elif self.config['migration'].get('truncate_destination', False):
             print("Truncating destination table...")
             self.dest_manager.truncate_table()
         
         print("✓ Destination table ready")
     
+    def load_resume_key(self, batch_path: bool = True):
+        """
+        Decide whether this run resumes from a checkpoint
+        
+        Must run before prepare_destination_table, which only skips the
+        truncate when a usable resume key was found. A checkpoint that can't
+        be used is discarded; if the destination wouldn't be truncated
+        either, starting over would duplicate the rows already loaded, so
+        that fails instead.
+        
+        Args:
+            batch_path: Whether the data will be moved by migrate_data (the
+                only path that reads checkpoints)
+        """
+        self.resume_key = None
+        if not self.config['migration'].get('resume', False) or not self.checkpoint.exists():
+            return
+        
+        source_table = self.source_manager.get_table_object()
+        primary_keys = [col for col in source_table.columns if col.primary_key] if source_table is not None else []
+        
+        if not batch_path:
+            reason = "only the default batch migration can resume"
+        elif not self.dest_manager.table_exists():
+            reason = "the destination table does not exist"
+        elif not primary_keys:
+            reason = "the source table has no primary key"
+        else:
+            self.resume_key = self.checkpoint.load(primary_keys)
+            if self.resume_key is not None:
+                return
+            reason = "it does not match the source table's primary key"
+        
+        if not self.config['migration'].get('truncate_destination', False):
+            raise RuntimeError(
+                f"Cannot resume from checkpoint {self.checkpoint.path}: {reason}. "
+                "Delete it or enable truncate_destination to start over"
+            )
+        
+        print(f"⚠ Ignoring checkpoint {self.checkpoint.path}: {reason} - starting over")
+        self.checkpoint.clear()
+    
+    def finalize_destination_table(self):
+        """Rebuild the primary key deferred by prepare_destination_table"""
+        if self.deferred_primary_key:
+            print("\nAdding primary key to destination table...")
+            self.dest_manager.add_primary_key(self.deferred_primary_key)
+            self.checkpoint.clear_deferred_key()
+            self.deferred_primary_key = None
+    
     def migrate_data(self):
         """Migrate data from source to destination in batches"""
         batch_size = self.config['migration'].get('batch_size', 1000)
@@ -111,10 +223,10 @@ class DataMigration:
         # Get destination table
         dest_table = self.dest_manager.get_table_object()
         
-        # Count total rows
-        total_rows = self.source_manager.get_row_count()
+        # Approximate count, only used to size the progress bar
+        total_rows = self.get_source_row_count()
         
-        if total_rows == 0:
+        if self._source_is_empty():
             print("\nNo data to migrate (source table is empty)")
             return
         
@@ -126,49 +238,395 @@ class DataMigration:
             pbar = tqdm(total=total_rows, unit=' rows', unit_scale=True)
         
         try:
-            source_engine = self.source_connector.get_engine()
             dest_engine = self.dest_connector.get_engine()
             
-            offset = 0
+            # Order by primary key if available, otherwise by first column
+            primary_keys = [col for col in source_table.columns if col.primary_key]
+            order_by = primary_keys or [source_table.columns[0]]
+            query = select(source_table).order_by(*order_by)
             migrated_count = 0
             
-            while offset < total_rows:
-                # Fetch batch from source
-                with source_engine.connect() as source_conn:
-                    # Add ORDER BY for SQL Server compatibility with OFFSET/LIMIT
-                    # Use primary key if available, otherwise use all columns
-                    primary_keys = [col for col in source_table.columns if col.primary_key]
-                    if primary_keys:
-                        query = select(source_table).order_by(*primary_keys).limit(batch_size).offset(offset)
-                    else:
-                        # If no primary key, order by first column
-                        query = select(source_table).order_by(source_table.columns[0]).limit(batch_size).offset(offset)
-                    
-                    result = source_conn.execute(query)
-                    rows = result.fetchall()
-                    
-                    if not rows:
+            # Continue after the last committed key of an interrupted run
+            if self.resume_key is not None:
+                print(f"Resuming after key {self.resume_key}")
+                query = query.where(keyset_condition(primary_keys, self.resume_key))
+            
+            # The producer reads sizer.size for each fetch, so batch sizes
+            # follow the insert times measured below
+            sizer = BatchSizer(
+                batch_size,
+                dest_engine.dialect.name,
+                len(dest_table.columns),
+                self.config['migration'].get('adaptive_batch_size', True)
+            )
+            
+            # Fetch on a background thread so source reads overlap destination writes
+            batches = queue.Queue(maxsize=4)
+            stop_event = threading.Event()
+            errors = []
+            producer = threading.Thread(
+                target=self._fetch_batches,
+                args=(query, sizer, batches, stop_event, errors),
+                daemon=True
+            )
+            producer.start()
+            
+            defer_indexes = self.config['migration'].get('defer_indexes', False)
+            loader = BulkLoader(
+                dest_table,
+                dest_engine.dialect.name,
+                self.config['migration'].get('bulk_mode', 'auto'),
+                source_columns=source_table.c.keys()
+            )
+            
+            # Commit on larger boundaries; each commit is a flush to disk
+            commit_rows = batch_size * self.config['migration'].get('commit_every_n_batches', 50)
+            
+            # Chunks inserted since the last commit, replayed if a too-large
+            # batch forces a rollback
+            pending = []
+            
+            try:
+                with dest_engine.connect() as dest_conn:
+                    loader.begin_session(dest_conn)
+                    if defer_indexes:
+                        self.dest_manager.begin_bulk_load(dest_conn)
+                    try:
+                        while (chunk := batches.get()) is not None:
+                            started = time.perf_counter()
+                            self._load_chunk(loader, dest_conn, chunk, sizer, pending)
+                            sizer.record(len(chunk), time.perf_counter() - started)
+                            
+                            if sum(len(rows) for rows in pending) >= commit_rows:
+                                dest_conn.commit()
+                                self._save_checkpoint(primary_keys, pending)
+                                pending.clear()
+                            
+                            migrated_count += len(chunk)
+                            
+                            if pbar:
+                                pbar.update(len(chunk))
+                                pbar.set_postfix(batch=sizer.size, refresh=False)
+                        
+                        dest_conn.commit()
+                        self._save_checkpoint(primary_keys, pending)
+                    finally:
+                        dest_conn.rollback()
+                        if defer_indexes:
+                            self.dest_manager.end_bulk_load(dest_conn)
+                        loader.end_session(dest_conn)
+            finally:
+                # Unblock the producer if we stopped early, then wait for it
+                stop_event.set()
+                while producer.is_alive():
+                    try:
+                        batches.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                producer.join()
+            
+            if errors:
+                raise errors[0]
+            
+            # Finished, so a later run must not resume from here
+            self.checkpoint.clear()
+            
+            if pbar:
+                pbar.close()
+            
+            print(f"\n✓ Migration completed! Migrated {migrated_count:,} rows")
+            
+        except Exception as e:
+            if pbar:
+                pbar.close()
+            raise RuntimeError(f"Migration failed: {str(e)}")
+    
+    def _save_checkpoint(self, primary_keys: list, pending: list):
+        """
+        Record the key of the last committed row
+        
+        Args:
+            primary_keys: Source primary key columns (nothing is saved without one)
+            pending: Chunks covered by the commit that just happened
+        """
+        if primary_keys and pending and pending[-1]:
+            last_row = pending[-1][-1]
+            self.checkpoint.save(primary_keys, [last_row[col.name] for col in primary_keys])
+    
+    def _load_chunk(self, loader: BulkLoader, dest_conn, chunk: list, sizer: BatchSizer,
+                    pending: list):
+        """
+        Insert a chunk, splitting it in half and retrying if the server
+        rejects it as too large
+        
+        Args:
+            loader: Bulk loader for the destination table
+            dest_conn: Destination connection
+            chunk: Row mappings to insert
+            sizer: Batch sizer, shrunk when a chunk is too large
+            pending: Chunks inserted in the open transaction; successfully
+                inserted chunks are appended
+        """
+        try:
+            loader.load(dest_conn, chunk)
+            pending.append(chunk)
+        except Exception as e:
+            if len(chunk) < 2 or not sizer.is_size_error(e):
+                raise
+            dest_conn.rollback()
+            sizer.shrink()
+            
+            # The rollback also discarded the uncommitted chunks before this one
+            for previous in pending:
+                loader.load(dest_conn, previous)
+            
+            middle = len(chunk) // 2
+            self._load_chunk(loader, dest_conn, chunk[:middle], sizer, pending)
+            self._load_chunk(loader, dest_conn, chunk[middle:], sizer, pending)
+    
+    def _fetch_batches(self, query, sizer: BatchSizer, batches: queue.Queue,
+                       stop_event: threading.Event, errors: list):
+        """
+        Stream source rows into a queue (runs on the producer thread)
+        
+        Args:
+            query: Ordered SELECT on the source table
+            sizer: Batch sizer whose current size is used for each fetch
+            batches: Queue receiving lists of row mappings, then a None sentinel
+            stop_event: Set by the consumer to abort early
+            errors: Collects any exception raised while fetching
+        """
+        try:
+            source_engine = self.source_connector.get_engine()
+            
+            # Stream one ordered SELECT through a server-side cursor so only
+            # a few batches are held in memory at a time
+            with source_engine.connect().execution_options(
+                stream_results=True,
+                yield_per=sizer.size
+            ) as source_conn:
+                result = source_conn.execute(query).mappings()
+                
+                # Rows arrive as mappings, which insert() accepts directly
+                while chunk := result.fetchmany(sizer.size):
+                    if stop_event.is_set():
                         break
+                    batches.put(chunk)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            batches.put(None)
+    
+    def migrate_data_parallel(self, workers: int = 4):
+        """
+        Migrate data using several worker processes, each copying one
+        contiguous primary key range
+        
+        Falls back to migrate_data() unless the source table has a single
+        integer primary key.
+        
+        Args:
+            workers: Number of worker processes
+        """
+        source_table = self.source_manager.get_table_object()
+        primary_keys = [col for col in source_table.columns if col.primary_key]
+        
+        if len(primary_keys) != 1:
+            print("\n⚠ Parallel migration needs a single-column primary key - migrating serially")
+            return self.migrate_data()
+        
+        pk = primary_keys[0]
+        with self.source_connector.get_engine().connect() as source_conn:
+            min_key, max_key = source_conn.execute(select(func.min(pk), func.max(pk))).one()
+        
+        if min_key is None:
+            print("\nNo data to migrate (source table is empty)")
+            return
+        
+        if not isinstance(min_key, int) or not isinstance(max_key, int):
+            print("\n⚠ Parallel migration needs an integer primary key - migrating serially")
+            return self.migrate_data()
+        
+        total_rows = self.get_source_row_count()
+        show_progress = self.config['migration'].get('show_progress', True)
+        
+        # Split [min_key, max_key] into contiguous ranges, one per worker
+        workers = max(1, min(workers, max_key - min_key + 1))
+        step = (max_key - min_key + 1) / workers
+        bounds = [min_key + round(step * i) for i in range(workers)] + [max_key]
+        ranges = [
+            (bounds[i], bounds[i + 1], i == workers - 1)
+            for i in range(workers)
+        ]
+        
+        print(f"\nStarting parallel migration with {workers} workers")
+        
+        # Initialize progress bar
+        pbar = None
+        if show_progress:
+            pbar = tqdm(total=total_rows, unit=' rows', unit_scale=True)
+        
+        try:
+            migrated_count = 0
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_migrate_key_range, self.config, lower, upper, include_upper)
+                    for lower, upper, include_upper in ranges
+                ]
+                for future in as_completed(futures):
+                    count = future.result()
+                    migrated_count += count
                     
-                    # Convert rows to dictionaries
-                    batch_data = []
-                    for row in rows:
-                        # Convert row to dictionary using column names
-                        row_dict = dict(zip(source_table.columns.keys(), row))
-                        batch_data.append(row_dict)
-                    
-                    # Insert batch into destination
-                    if batch_data:
-                        with dest_engine.connect() as dest_conn:
-                            dest_conn.execute(insert(dest_table), batch_data)
-                            dest_conn.commit()
-                        
-                        migrated_count += len(batch_data)
-                        
-                        if pbar:
-                            pbar.update(len(batch_data))
+                    if pbar:
+                        pbar.update(count)
+            
+            if pbar:
+                pbar.close()
+            
+            print(f"\n✓ Migration completed! Migrated {migrated_count:,} rows")
+            
+        except Exception as e:
+            if pbar:
+                pbar.close()
+            raise RuntimeError(f"Migration failed: {str(e)}")
+    
+    def get_server_side_schemas(self):
+        """
+        Work out whether source and destination can be copied with a single
+        server-side INSERT ... SELECT
+        
+        That needs the same database type, host, port and login (the
+        destination login must be able to read the source). Across databases
+        on one server, MySQL and SQL Server can address the source by a
+        database-qualified name; PostgreSQL would need postgres_fdw, so it is
+        not attempted.
+        
+        Returns:
+            (source_schema, dest_schema) to address the tables with from the
+            destination connection, or None if rows must go through Python
+        """
+        source = self.config['source']
+        dest = self.config['destination']
+        
+        for key in ('db_type', 'host', 'port', 'username'):
+            if source.get(key) != dest.get(key):
+                return None
+        
+        source_schema = self.source_manager.schema
+        dest_schema = self.dest_manager.schema
+        
+        if source.get('database') == dest.get('database'):
+            return source_schema, dest_schema
+        
+        db_type = source.get('db_type', '').lower()
+        if db_type == 'mysql':
+            # MySQL databases are schemas
+            return source_schema or source['database'], dest_schema or dest['database']
+        if db_type == 'mssql':
+            return (
+                f"{source['database']}.{source_schema or 'dbo'}",
+                f"{dest['database']}.{dest_schema or 'dbo'}"
+            )
+        
+        return None
+    
+    def migrate_data_server_side(self, schemas):
+        """
+        Copy all rows with one INSERT ... SELECT executed by the destination
+        server, so no data passes through Python
+        
+        Args:
+            schemas: (source_schema, dest_schema) from get_server_side_schemas()
+        """
+        source_schema, dest_schema = schemas
+        
+        # Re-home the reflected tables under names the destination can resolve
+        metadata = MetaData()
+        source_table = self.source_manager.get_table_object().to_metadata(metadata, schema=source_schema)
+        dest_table = self.dest_manager.get_table_object().to_metadata(metadata, schema=dest_schema)
+        
+        columns = [col.name for col in dest_table.columns if col.name in source_table.c]
+        query = insert(dest_table).from_select(
+            columns,
+            select(*[source_table.c[name] for name in columns])
+        )
+        
+        # SQL Server rejects explicit identity values unless IDENTITY_INSERT
+        # is on, and SQLAlchemy only sets it for bound parameters
+        dest_engine = self.dest_connector.get_engine()
+        identity_insert = dest_engine.dialect.name == 'mssql' and any(
+            col.identity is not None or col.autoincrement is True
+            for col in dest_table.columns if col.name in columns
+        )
+        
+        print("\nSource and destination share a server - copying with INSERT ... SELECT")
+        
+        try:
+            with dest_engine.begin() as dest_conn:
+                if identity_insert:
+                    quoted = dest_conn.dialect.identifier_preparer.format_table(dest_table)
+                    dest_conn.exec_driver_sql(f"SET IDENTITY_INSERT {quoted} ON", NO_PARAMETERS)
+                    try:
+                        migrated_count = dest_conn.execute(query).rowcount
+                    finally:
+                        dest_conn.exec_driver_sql(f"SET IDENTITY_INSERT {quoted} OFF", NO_PARAMETERS)
+                else:
+                    migrated_count = dest_conn.execute(query).rowcount
+            
+            if migrated_count is not None and migrated_count >= 0:
+                print(f"\n✓ Migration completed! Migrated {migrated_count:,} rows")
+            else:
+                print("\n✓ Migration completed!")
+            
+        except Exception as e:
+            raise RuntimeError(f"Migration failed: {str(e)}")
+    
+    def migrate_data_arrow(self):
+        """
+        Migrate data as Arrow tables (connectorx on the source, ADBC ingest
+        or pandas on the destination), avoiding per-row Python objects
+        """
+        show_progress = self.config['migration'].get('show_progress', True)
+        
+        source_table = self.source_manager.get_table_object()
+        dest_table = self.dest_manager.get_table_object()
+        
+        # Approximate count, only used to size the progress bar
+        total_rows = self.get_source_row_count()
+        
+        if self._source_is_empty():
+            print("\nNo data to migrate (source table is empty)")
+            return
+        
+        transfer = ArrowTransfer(
+            self.source_connector,
+            self.dest_connector,
+            source_table,
+            dest_table,
+            window_rows=self.config['migration'].get('arrow_window_rows', 1000000),
+            partitions=self.config['migration'].get('arrow_partitions', 4)
+        )
+        
+        print("\nStarting Arrow migration")
+        
+        # Initialize progress bar
+        pbar = None
+        if show_progress:
+            pbar = tqdm(total=total_rows, unit=' rows', unit_scale=True)
+        
+        try:
+            migrated_count = 0
+            
+            for arrow_table in transfer.read_windows():
+                if arrow_table.num_rows == 0:
+                    continue
+                
+                transfer.write(arrow_table)
+                migrated_count += arrow_table.num_rows
                 
-                offset += batch_size
+                if pbar:
+                    pbar.update(arrow_table.num_rows)
             
             if pbar:
                 pbar.close()
@@ -180,6 +638,119 @@ class DataMigration:
                 pbar.close()
             raise RuntimeError(f"Migration failed: {str(e)}")
     
+    async def migrate_data_async(self):
+        """
+        Migrate data using asyncio drivers (asyncpg, aiomysql, aioodbc,
+        aiosqlite), overlapping source reads and destination writes on one
+        event loop
+        
+        Schema work still goes through the sync connectors; this only moves
+        the rows.
+        """
+        batch_size = self.config['migration'].get('batch_size', 1000)
+        page_size = self.config['migration'].get('executemany_page_size', 1000)
+        show_progress = self.config['migration'].get('show_progress', True)
+        defer_indexes = self.config['migration'].get('defer_indexes', False)
+        
+        source_table = self.source_manager.get_table_object()
+        dest_table = self.dest_manager.get_table_object()
+        
+        # Approximate count, only used to size the progress bar
+        total_rows = self.get_source_row_count()
+        
+        if self._source_is_empty():
+            print("\nNo data to migrate (source table is empty)")
+            return
+        
+        print(f"\nStarting async migration with batch size: {batch_size:,}")
+        
+        source_connector = DatabaseConnector(self.config['source'], page_size, async_mode=True)
+        dest_connector = DatabaseConnector(self.config['destination'], page_size, async_mode=True)
+        
+        # Initialize progress bar
+        pbar = None
+        if show_progress:
+            pbar = tqdm(total=total_rows, unit=' rows', unit_scale=True)
+        
+        try:
+            source_engine = await source_connector.connect_async()
+            dest_engine = await dest_connector.connect_async()
+            
+            # Order by primary key if available, otherwise by first column
+            primary_keys = [col for col in source_table.columns if col.primary_key]
+            order_by = primary_keys or [source_table.columns[0]]
+            query = select(source_table).order_by(*order_by)
+            migrated_count = 0
+            
+            # Native bulk paths need the sync drivers, so always INSERT here
+            loader = BulkLoader(dest_table, dest_engine.dialect.name, mode='off')
+            commit_every = self.config['migration'].get('commit_every_n_batches', 50)
+            
+            batches = asyncio.Queue(maxsize=4)
+            
+            async def fetch_batches():
+                try:
+                    async with source_engine.connect() as source_conn:
+                        result = await source_conn.stream(
+                            query,
+                            execution_options={'yield_per': batch_size}
+                        )
+                        async for chunk in result.mappings().partitions(batch_size):
+                            await batches.put(chunk)
+                except Exception:
+                    await batches.put(None)
+                    raise
+                await batches.put(None)
+            
+            producer = asyncio.create_task(fetch_batches())
+            
+            try:
+                async with dest_engine.connect() as dest_conn:
+                    await dest_conn.run_sync(loader.begin_session)
+                    if defer_indexes:
+                        await dest_conn.run_sync(self.dest_manager.begin_bulk_load)
+                    try:
+                        batch_number = 0
+                        while (chunk := await batches.get()) is not None:
+                            await dest_conn.execute(loader.insert_stmt, chunk)
+                            
+                            batch_number += 1
+                            if batch_number % commit_every == 0:
+                                await dest_conn.commit()
+                            
+                            migrated_count += len(chunk)
+                            
+                            if pbar:
+                                pbar.update(len(chunk))
+                        
+                        await dest_conn.commit()
+                    finally:
+                        await dest_conn.rollback()
+                        if defer_indexes:
+                            await dest_conn.run_sync(self.dest_manager.end_bulk_load)
+                        await dest_conn.run_sync(loader.end_session)
+            except BaseException:
+                # Wait for the cancelled producer so it closes its connection
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+                raise
+            
+            # Re-raise any error from the fetch side
+            await producer
+            
+            if pbar:
+                pbar.close()
+            
+            print(f"\n✓ Migration completed! Migrated {migrated_count:,} rows")
+            
+        except Exception as e:
+            if pbar:
+                pbar.close()
+            raise RuntimeError(f"Migration failed: {str(e)}")
+        finally:
+            await source_connector.close_async()
+            await dest_connector.close_async()
+    
     def verify_migration(self, initial_source_count: int):
         """Verify that migration was successful"""
         print("\nVerifying migration...")
@@ -190,6 +761,9 @@ class DataMigration:
         print(f"Final source count: {final_source_count:,}")
         print(f"Final destination count: {final_dest_count:,}")
         
+        # The initial count may be an estimate, so bound it by the exact final count
+        initial_source_count = min(initial_source_count, final_source_count)
+        
         # Check if counts match (source count might have changed during migration)
         if final_dest_count >= initial_source_count:
             print("✓ Verification: All rows migrated successfully")
@@ -205,11 +779,61 @@ class DataMigration:
             # Show initial counts
             source_count, dest_count = self.show_row_counts()
             
+            # Pick the data path first; only migrate_data can resume
+            workers = self.config['migration'].get('parallel_workers', 1)
+            schemas = None
+            if self.config['migration'].get('server_side_copy', False):
+                schemas = self.get_server_side_schemas()
+            arrow = self.config['migration'].get('engine') == 'arrow'
+            self.load_resume_key(batch_path=schemas is None and not arrow and workers <= 1)
+            
+            # Prepare destination
+            self.prepare_destination_table()
+            
+            # Migrate data
+            if schemas is not None:
+                self.migrate_data_server_side(schemas)
+            elif arrow:
+                self.migrate_data_arrow()
+            elif workers > 1:
+                self.migrate_data_parallel(workers)
+            else:
+                self.migrate_data()
+            self.finalize_destination_table()
+            
+            # Verify migration
+            self.verify_migration(source_count)
+            
+            print("\n=== Migration Complete ===\n")
+            
+        except Exception as e:
+            print(f"\n❌ Error: {str(e)}")
+            raise
+        finally:
+            # Close connections
+            if self.source_connector:
+                self.source_connector.close()
+            if self.dest_connector:
+                self.dest_connector.close()
+    
+    async def run_async(self):
+        """Execute the complete migration process with the async data path"""
+        try:
+            # Connect to databases
+            self.connect_databases()
+            
+            # Show initial counts
+            source_count, dest_count = self.show_row_counts()
+            
+            # The async path doesn't read checkpoints
+            self.load_resume_key(batch_path=False)
+            
             # Prepare destination
             self.prepare_destination_table()
             
             # Migrate data
-            self.migrate_data()
+            await self.migrate_data_async()
+            self.finalize_destination_table()
             
             # Verify migration
             self.verify_migration(source_count)
@@ -227,6 +851,81 @@ class DataMigration:
                 self.dest_connector.close()
 
 
+def _migrate_key_range(config: dict, lower: int, upper: int, include_upper: bool) -> int:
+    """
+    Migrate one primary key range (runs in a worker process)
+    
+    Each worker opens its own connections since engines cannot be shared
+    across processes.
+    
+    Args:
+        config: Full migration configuration
+        lower: First key of the range (inclusive)
+        upper: Last key of the range
+        include_upper: Whether upper itself belongs to this range
+        
+    Returns:
+        Number of rows migrated
+    """
+    batch_size = config['migration'].get('batch_size', 1000)
+    page_size = config['migration'].get('executemany_page_size', 1000)
+    commit_every = config['migration'].get('commit_every_n_batches', 50)
+    
+    source_connector = DatabaseConnector(config['source'], executemany_page_size=page_size)
+    dest_connector = DatabaseConnector(config['destination'], executemany_page_size=page_size)
+    
+    try:
+        source_engine = source_connector.get_engine()
+        dest_engine = dest_connector.get_engine()
+        
+        # The parent process already checked both tables exist
+        source_table = TableManager(
+            source_engine, config['source']['table'], assume_exists=True
+        ).get_table_object()
+        dest_manager = TableManager(dest_engine, config['destination']['table'], assume_exists=True)
+        dest_table = dest_manager.get_table_object()
+        defer_indexes = config['migration'].get('defer_indexes', False)
+        loader = BulkLoader(
+            dest_table,
+            dest_engine.dialect.name,
+            config['migration'].get('bulk_mode', 'auto'),
+            source_columns=source_table.c.keys()
+        )
+        
+        pk = [col for col in source_table.columns if col.primary_key][0]
+        upper_bound = pk <= upper if include_upper else pk < upper
+        query = select(source_table).where(pk >= lower, upper_bound).order_by(pk)
+        migrated_count = 0
+        
+        with source_engine.connect().execution_options(
+            stream_results=True,
+            yield_per=batch_size
+        ) as source_conn, dest_engine.connect() as dest_conn:
+            loader.begin_session(dest_conn)
+            if defer_indexes:
+                dest_manager.begin_bulk_load(dest_conn)
+            try:
+                result = source_conn.execute(query)
+                
+                for number, chunk in enumerate(result.mappings().partitions(batch_size), 1):
+                    loader.load(dest_conn, chunk)
+                    if number % commit_every == 0:
+                        dest_conn.commit()
+                    migrated_count += len(chunk)
+                
+                dest_conn.commit()
+            finally:
+                dest_conn.rollback()
+                if defer_indexes:
+                    dest_manager.end_bulk_load(dest_conn)
+                loader.end_session(dest_conn)
+        
+        return migrated_count
+    finally:
+        source_connector.close()
+        dest_connector.close()
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Database Migration Tool")
@@ -241,7 +940,10 @@ def main():
     
     # Run migration
     migration = DataMigration(config_path=args.config)
-    migration.run()
+    if migration.config['migration'].get('async_mode', False):
+        asyncio.run(migration.run_async())
+    else:
+        migration.run()
 
 
 if __name__ == "__main__":
@@ -2,12 +2,12 @@
 Data synchronization script - syncs only new/missing rows from source to destination
 """
 import argparse
-import yaml
 from tqdm import tqdm
 from sqlalchemy import select, insert, inspect
 
+from config_loader import load_config
 from db_connector import DatabaseConnector
-from table_manager import TableManager
+from table_manager import TableManager, keyset_condition
 
 
 class DataSync:
@@ -30,9 +30,7 @@ class DataSync:
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file"""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config
+            return load_config(config_path)
         except Exception as e:
             raise RuntimeError(f"Failed to load config from {config_path}: {str(e)}")
     
@@ -45,12 +43,18 @@ class DataSync:
         print("\nChecking connections...")
         
         # Connect to source
-        self.source_connector = DatabaseConnector(self.config['source'])
+        self.source_connector = DatabaseConnector(
+            self.config['source'],
+            executemany_page_size=self.config['migration'].get('executemany_page_size', 1000)
+        )
         self.source_connector.connect()
         print("✓ Source connection successful")
         
         # Connect to destination
-        self.dest_connector = DatabaseConnector(self.config['destination'])
+        self.dest_connector = DatabaseConnector(
+            self.config['destination'],
+            executemany_page_size=self.config['migration'].get('executemany_page_size', 1000)
+        )
         self.dest_connector.connect()
         print("✓ Destination connection successful")
         
@@ -80,6 +84,25 @@ class DataSync:
                 return column.name
         return None
     
+    def get_last_synced_key(self, dest_table, primary_keys):
+        """
+        Get the highest primary key already present in the destination
+        
+        Args:
+            dest_table: Destination SQLAlchemy Table object
+            primary_keys: Source primary key columns
+            
+        Returns:
+            Tuple of key values, or None if destination is empty
+        """
+        key_columns = [dest_table.c[col.name] for col in primary_keys]
+        query = select(*key_columns).order_by(*[col.desc() for col in key_columns]).limit(1)
+        
+        with self.dest_connector.get_engine().connect() as dest_conn:
+            row = dest_conn.execute(query).first()
+        
+        return tuple(row) if row is not None else None
+    
     def analyze_sync_status(self):
         """Analyze what needs to be synced"""
         print("\nAnalyzing sync status...")
@@ -157,57 +180,38 @@ class DataSync:
             source_engine = self.source_connector.get_engine()
             dest_engine = self.dest_connector.get_engine()
             
-            # Start from where destination left off
-            offset = dest_count
+            # Resume after the last key in destination; tables without a
+            # primary key fall back to skipping the rows already synced
+            primary_keys = [col for col in source_table.columns if col.primary_key]
+            if primary_keys:
+                query = select(source_table).order_by(*primary_keys)
+                last_key = self.get_last_synced_key(dest_table, primary_keys)
+                if last_key is not None:
+                    query = query.where(keyset_condition(primary_keys, last_key))
+            else:
+                # Add ORDER BY for SQL Server compatibility with OFFSET
+                query = select(source_table).order_by(source_table.columns[0]).offset(dest_count)
+            
+            insert_stmt = insert(dest_table)
             synced_count = 0
             
-            while offset < source_count:
-                # Calculate batch size (don't exceed remaining rows)
-                current_batch_size = min(batch_size, source_count - offset)
+            # Stream one SELECT through a server-side cursor so only one
+            # batch is held in memory at a time
+            with source_engine.connect().execution_options(
+                stream_results=True,
+                yield_per=batch_size
+            ) as source_conn, dest_engine.connect() as dest_conn:
+                result = source_conn.execute(query)
                 
-                # Fetch batch from source (starting from offset)
-                with source_engine.connect() as source_conn:
-                    # Add ORDER BY for SQL Server compatibility with OFFSET/LIMIT
-                    # Use primary key if available, otherwise use first column
-                    if self.primary_key_column:
-                        query = (
-                            select(source_table)
-                            .order_by(source_table.c[self.primary_key_column])
-                            .limit(current_batch_size)
-                            .offset(offset)
-                        )
-                    else:
-                        # Use primary keys if available, otherwise first column
-                        primary_keys = [col for col in source_table.columns if col.primary_key]
-                        if primary_keys:
-                            query = select(source_table).order_by(*primary_keys).limit(current_batch_size).offset(offset)
-                        else:
-                            query = select(source_table).order_by(source_table.columns[0]).limit(current_batch_size).offset(offset)
-                    
-                    result = source_conn.execute(query)
-                    rows = result.fetchall()
+                # Rows arrive as mappings, which insert() accepts directly
+                for chunk in result.mappings().partitions(batch_size):
+                    dest_conn.execute(insert_stmt, chunk)
+                    dest_conn.commit()
                     
-                    if not rows:
-                        break
+                    synced_count += len(chunk)
                     
-                    # Convert rows to dictionaries
-                    batch_data = []
-                    for row in rows:
-                        row_dict = dict(zip(source_table.columns.keys(), row))
-                        batch_data.append(row_dict)
-                    
-                    # Insert batch into destination
-                    if batch_data:
-                        with dest_engine.connect() as dest_conn:
-                            dest_conn.execute(insert(dest_table), batch_data)
-                            dest_conn.commit()
-                        
-                        synced_count += len(batch_data)
-                        
-                        if pbar:
-                            pbar.update(len(batch_data))
-                
-                offset += current_batch_size
+                    if pbar:
+                        pbar.update(len(chunk))
             
             if pbar:
                 pbar.close()
@@ -1,156 +1,1042 @@
 """
 Table management module for schema extraction and table creation
 """
-from sqlalchemy import Table, MetaData, Column, inspect, text
+from sqlalchemy import Table, MetaData, Column, Enum, inspect, select, text, and_, or_
 from sqlalchemy.engine import Engine
-from typing import Optional
+from sqlalchemy.exc import DBAPIError, NoSuchTableError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable, SetColumnComment, SetTableComment
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from inspect import iscoroutinefunction
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Static SQL run through exec_driver_sql; stops pyformat drivers from reading
+# a % in an identifier as a placeholder
+NO_PARAMETERS = {'no_parameters': True}
+
+
+def _rerr(message: str):
+    """
+    Decorator wrapping a method's failures in RuntimeError
+    
+    Args:
+        message: Error prefix, formatted with the instance as ``self``
+            (e.g. "Failed to truncate table {self.table_name}")
+    """
+    def decorator(method):
+        if iscoroutinefunction(method):
+            @wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await method(self, *args, **kwargs)
+                except Exception as e:
+                    raise RuntimeError(f"{message.format(self=self)}: {str(e)}") from e
+            return async_wrapper
+        
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                raise RuntimeError(f"{message.format(self=self)}: {str(e)}") from e
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=65536)
+def _split_schema(table_name: str) -> Tuple[Optional[str], str]:
+    """
+    Split 'schema.table' into its parts
+    
+    Args:
+        table_name: Table name, optionally prefixed with a schema
+    
+    Returns:
+        (schema, table) with schema None when there is no prefix
+        (e.g., 'dsc.AddressTypes' -> ('dsc', 'AddressTypes'))
+    """
+    schema, dot, table = table_name.partition('.')
+    return (schema, table) if dot else (None, table_name)
+
+
+@lru_cache(maxsize=4096)
+def _quote(dialect, schema: Optional[str], name: str) -> str:
+    """
+    Quote a (schema-qualified) table or column name for a dialect
+    
+    Keyed on the dialect instance rather than its name, since quoting rules
+    can depend on the server (e.g. MySQL vs MariaDB reserved words).
+    
+    Args:
+        dialect: Dialect of the engine the table lives in
+        schema: Schema name, or None
+        name: Table name
+    
+    Returns:
+        Quoted name, safe to interpolate into SQL
+    """
+    preparer = dialect.identifier_preparer
+    if schema:
+        return f"{preparer.quote_schema(schema)}.{preparer.quote(name)}"
+    return preparer.quote(name)
+
+
+def keyset_condition(columns: Sequence[Column], last_key: Sequence):
+    """
+    Build a WHERE clause selecting rows that sort after last_key
+    
+    Row-value comparison ``(a, b) > (x, y)`` is not supported by every
+    dialect (e.g. SQL Server), so composite keys are expanded to
+    ``a > x OR (a = x AND b > y)``.
+    
+    Args:
+        columns: Ordered key columns
+        last_key: Key values of the last row already processed
+        
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        equals = [columns[j] == last_key[j] for j in range(i)]
+        clauses.append(and_(*equals, column > last_key[i]))
+    return or_(*clauses)
 
 
 class TableManager:
     """Manages table operations including schema extraction and creation"""
     
-    def __init__(self, engine: Engine, table_name: str):
+    # Migrations may hold a manager per table, so skip the per-instance dict
+    __slots__ = (
+        'engine', 'table_name', 'schema', 'table_name_only', 'metadata',
+        '_dialect', '_quoted', '_count_stmt', '_truncate_sql',
+        '_table', '_exists', '_inspector', '_table_names_cache',
+    )
+    
+    def __init__(self, engine: Engine, table_name: str, assume_exists: bool = False):
         """
         Initialize table manager
         
         Args:
             engine: SQLAlchemy engine
             table_name: Name of the table (can include schema like 'schema.table')
+            assume_exists: If True, skip the catalog lookup in table_exists()
+                (for callers that already verified the table)
         """
         self.engine = engine
         self.table_name = table_name
-        self.schema = None
-        self.table_name_only = table_name
+        self.schema, self.table_name_only = _split_schema(table_name)
         
-        # Parse schema if present (e.g., 'dsc.AddressTypes' -> schema='dsc', table='AddressTypes')
-        if '.' in table_name:
-            parts = table_name.split('.', 1)
-            self.schema = parts[0]
-            self.table_name_only = parts[1]
+        self._dialect = engine.dialect.name
         
-        self.metadata = MetaData()
+        # Quote once and keep the count statement, so each call reuses the same
+        # text() object and hits SQLAlchemy's compiled cache
+        self._quoted = _quote(engine.dialect, self.schema, self.table_name_only)
+        self._count_stmt = text(f"SELECT COUNT(*) FROM {self._quoted}")
         
+        # Static DDL, sent with exec_driver_sql to skip compilation entirely
+        if self._dialect == 'postgresql':
+            # CASCADE empties referencing tables instead of failing
+            self._truncate_sql = f"TRUNCATE TABLE {self._quoted} RESTART IDENTITY CASCADE"
+        elif self._dialect == 'sqlite':
+            # SQLite doesn't support TRUNCATE
+            self._truncate_sql = f"DELETE FROM {self._quoted}"
+        else:
+            self._truncate_sql = f"TRUNCATE TABLE {self._quoted}"
+        
+        # Created when first needed; see _get_metadata()
+        self.metadata: Optional[MetaData] = None
+        self._table = None
+        self._exists = assume_exists
+        
+        # Catalog lookups are cached per instance; see invalidate()
+        self._inspector = None
+        self._table_names_cache: Dict[Optional[str], Set[str]] = {}
+        
+    @classmethod
+    def bulk_prepare(cls, engine: Engine, table_names: Sequence[str]) -> Dict[str, 'TableManager']:
+        """
+        Create managers for many tables, reflecting them in one pass per schema
+        
+        Args:
+            engine: SQLAlchemy engine
+            table_names: Table names (can include schema like 'schema.table')
+        
+        Returns:
+            Dictionary of table name to TableManager; tables that exist are
+            already reflected
+        """
+        managers = {name: cls(engine, name) for name in table_names}
+        inspector = inspect(engine)
+        
+        by_schema: Dict[Optional[str], list] = {}
+        for manager in managers.values():
+            by_schema.setdefault(manager.schema, []).append(manager)
+        
+        try:
+            for schema, group in by_schema.items():
+                names = set(inspector.get_table_names(schema=schema))
+                present = [m for m in group if m.table_name_only in names]
+                
+                # One MetaData per schema, so a table named both with and
+                # without its default schema can't collide
+                metadata = MetaData()
+                if present:
+                    metadata.reflect(
+                        bind=engine,
+                        schema=schema,
+                        only=[m.table_name_only for m in present]
+                    )
+                
+                for manager in group:
+                    manager._table_names_cache[schema] = names
+                for manager in present:
+                    key = f"{schema}.{manager.table_name_only}" if schema else manager.table_name_only
+                    manager.metadata = metadata
+                    manager._table = metadata.tables[key]
+                    manager._table.info['dialect'] = manager._dialect
+                    manager._exists = True
+        except Exception as e:
+            raise RuntimeError(f"Failed to reflect tables: {str(e)}")
+        
+        return managers
+    
+    @classmethod
+    def exists_many(cls, engine: Engine, table_names: Sequence[str],
+                    max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Check whether several tables exist, probing schemas concurrently
+        
+        Each schema's table list is fetched once, on its own thread, so
+        tables in different schemas don't wait on each other.
+        
+        Args:
+            engine: SQLAlchemy engine
+            table_names: Table names (can include schema like 'schema.table')
+            max_workers: Thread count; defaults to the engine's pool size so
+                no thread waits for a connection
+        
+        Returns:
+            Dictionary of table name to whether it exists
+        """
+        managers = {name: cls(engine, name) for name in table_names}
+        
+        leaders: Dict[Optional[str], 'TableManager'] = {}
+        for manager in managers.values():
+            leaders.setdefault(manager.schema, manager)
+        
+        if max_workers is None:
+            pool_size = getattr(engine.pool, 'size', None)
+            max_workers = pool_size() if callable(pool_size) else 1
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                # Each leader has its own inspector, so threads share no state
+                results = executor.map(
+                    lambda m: set(m._get_inspector().get_table_names(schema=m.schema)),
+                    leaders.values()
+                )
+                names_by_schema = dict(zip(leaders, results))
+        except Exception as e:
+            raise RuntimeError(f"Failed to check tables: {str(e)}")
+        
+        exists = {}
+        for name, manager in managers.items():
+            manager._table_names_cache[manager.schema] = names_by_schema[manager.schema]
+            exists[name] = manager.table_exists()
+        return exists
+    
     def table_exists(self) -> bool:
         """
         Check if table exists in database
         
+        A positive result is remembered, since tables are never dropped here.
+        
         Returns:
             True if table exists, False otherwise
         """
-        inspector = inspect(self.engine)
-        if self.schema:
-            return self.table_name_only in inspector.get_table_names(schema=self.schema)
-        else:
-            return self.table_name_only in inspector.get_table_names()
+        if self._exists:
+            return True
+        
+        names = self._table_names_cache.get(self.schema)
+        if names is None:
+            names = set(self._get_inspector().get_table_names(schema=self.schema))
+            self._table_names_cache[self.schema] = names
+        
+        self._exists = self.table_name_only in names
+        return self._exists
+    
+    def _get_inspector(self):
+        """Return the inspector, creating it on first use (it may cost a round trip)"""
+        if self._inspector is None:
+            self._inspector = inspect(self.engine)
+        return self._inspector
     
-    def get_table_object(self) -> Optional[Table]:
+    def _get_metadata(self, metadata: Optional[MetaData] = None) -> MetaData:
+        """
+        Return the MetaData this table lives in, creating it on first use
+        
+        Args:
+            metadata: MetaData to adopt if none has been used yet
+        """
+        if self.metadata is None:
+            self.metadata = metadata if metadata is not None else MetaData()
+        return self.metadata
+    
+    def invalidate(self):
+        """Forget cached catalog information (call after DDL on this schema)"""
+        self._table_names_cache.pop(self.schema, None)
+        if self._inspector is not None:
+            self._inspector.clear_cache()
+    
+    @_rerr("Failed to reflect table {self.table_name}")
+    def get_table_object(self, metadata: Optional[MetaData] = None) -> Optional[Table]:
         """
         Get SQLAlchemy Table object by reflecting from database
         
+        The table is reflected once and reused on later calls. Reflection
+        itself tells us whether the table exists, so there is no separate
+        existence check. It goes through this manager's inspector, so the
+        catalog queries it makes land in the same info_cache that
+        table_exists() uses.
+        
+        Args:
+            metadata: Optional MetaData to reflect into, so callers reflecting
+                many tables can share one
+        
         Returns:
             Table object or None if table doesn't exist
         """
-        if not self.table_exists():
+        if self._table is not None:
+            return self._table
+        
+        if self._known_missing():
             return None
         
+        metadata = self._get_metadata(metadata)
+        table = Table(self.table_name_only, metadata, schema=self.schema)
+        
         try:
-            table = Table(
-                self.table_name_only,
-                self.metadata,
-                schema=self.schema,
-                autoload_with=self.engine
-            )
-            return table
-        except Exception as e:
-            raise RuntimeError(f"Failed to reflect table {self.table_name}: {str(e)}")
+            # A shared MetaData may already hold the reflected table
+            if not table.columns:
+                self._get_inspector().reflect_table(table, None)
+        except NoSuchTableError:
+            metadata.remove(table)
+            return None
+        except Exception:
+            metadata.remove(table)
+            raise
+        
+        table.info['dialect'] = self._dialect
+        self._table = table
+        self._exists = True
+        return table
     
-    def get_row_count(self) -> int:
+    def dump_metadata(self, path: str):
         """
-        Get the number of rows in the table
+        Save the reflected table to a file so later runs can skip reflection
+        
+        Args:
+            path: File to write (see load_metadata)
+        """
+        table = self.get_table_object()
+        if table is None:
+            raise RuntimeError(f"Table {self.table_name} does not exist")
+        
+        data = {
+            'table_name': self.table_name,
+            'database': self.engine.url.database,
+            'schema_hash': self._schema_hash(),
+            'table': table,
+        }
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    
+    @classmethod
+    def load_metadata(cls, engine: Engine, table_name: str, path: str) -> 'TableManager':
+        """
+        Create a manager whose table comes from a dump_metadata file
+        
+        The saved table is only used if it was dumped for the same table and
+        database and the schema still lists the same tables; otherwise the
+        manager reflects as usual. Only load files this tool wrote, since
+        they are pickles.
+        
+        Args:
+            engine: SQLAlchemy engine
+            table_name: Name of the table (can include schema like 'schema.table')
+            path: File written by dump_metadata
         
         Returns:
-            Row count
+            TableManager
+        """
+        manager = cls(engine, table_name)
+        
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return manager
+        
+        if (data.get('table_name') == table_name
+                and data.get('database') == engine.url.database
+                and data.get('schema_hash') == manager._schema_hash()):
+            table = data['table']
+            manager.metadata = table.metadata
+            manager._table = table
+            manager._exists = True
+        else:
+            print(f"⚠ Cached metadata for {table_name} doesn't match the database - reflecting instead")
+        
+        return manager
+    
+    def _schema_hash(self) -> str:
+        """Hash the schema's table list (uses the cached list if present)"""
+        names = self._table_names_cache.get(self.schema)
+        if names is None:
+            names = set(self._get_inspector().get_table_names(schema=self.schema))
+            self._table_names_cache[self.schema] = names
+        return hashlib.sha1("\n".join(sorted(names)).encode('utf-8')).hexdigest()
+    
+    def stream(self, chunk_size: int = 10000) -> Iterator[List[Mapping[str, Any]]]:
+        """
+        Read the whole table in chunks through a server-side cursor
+        
+        Memory stays bounded by chunk_size instead of the driver buffering
+        the full result.
+        
+        Args:
+            chunk_size: Rows per chunk
+        
+        Yields:
+            Lists of row mappings keyed by column name
+        """
+        table = self.get_table_object()
+        if table is None:
+            raise RuntimeError(f"Table {self.table_name} does not exist")
+        
+        with self.engine.connect().execution_options(
+            stream_results=True,
+            yield_per=chunk_size
+        ) as conn:
+            result = conn.execute(select(table))
+            for chunk in result.mappings().partitions(chunk_size):
+                yield chunk
+    
+    @_rerr("Failed to get row count for {self.table_name}")
+    def get_row_count(self, exact: bool = True) -> int:
         """
-        if not self.table_exists():
-            return 0
+        Get the number of rows in the table
         
+        Args:
+            exact: If False, read the estimate kept in the database's statistics
+                catalog instead of scanning the table with COUNT(*)
+        
+        Returns:
+            Row count (0 if the table doesn't exist)
+        """
+        # Query first and only consult the catalog if that fails, saving a
+        # round trip in the common case
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(
-                    text(f"SELECT COUNT(*) FROM {self.table_name}")
-                )
+                if not exact:
+                    count = self._estimate_row_count(conn)
+                    if count is not None:
+                        return count
+                
+                result = conn.execute(self._count_stmt)
                 count = result.scalar()
                 return count
-        except Exception as e:
-            raise RuntimeError(f"Failed to get row count for {self.table_name}: {str(e)}")
+        except Exception:
+            if not self.table_exists():
+                return 0
+            raise
     
-    def create_table_from_source(self, source_table: Table):
+    def _estimate_row_count(self, conn) -> Optional[int]:
+        """
+        Read the approximate row count from the statistics catalog
+        
+        Args:
+            conn: Open connection to use
+        
+        Returns:
+            Estimated row count, or None if the dialect has no estimate
+            (or the table has never been analyzed)
+        """
+        db_name = self._dialect
+        
+        if db_name == 'postgresql':
+            # to_regclass resolves the name through search_path like the
+            # table itself would be, and returns NULL instead of failing
+            query = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:quoted)")
+        elif db_name == 'mssql':
+            query = text(
+                "SELECT SUM(row_count) FROM sys.dm_db_partition_stats "
+                "WHERE object_id = OBJECT_ID(:name) AND index_id < 2"
+            )
+        elif db_name == 'mysql':
+            query = text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_NAME = :table AND TABLE_SCHEMA = COALESCE(:schema, DATABASE())"
+            )
+        else:
+            return None
+        
+        params = {
+            'name': self.table_name,
+            'quoted': self._quoted,
+            'table': self.table_name_only,
+            'schema': self.schema
+        }
+        count = conn.execute(query, params).scalar()
+        
+        # PostgreSQL reports -1 for tables that have never been analyzed
+        if count is None or count < 0:
+            return None
+        return int(count)
+    
+    @_rerr("Failed to create table {self.table_name}")
+    def create_table_from_source(self, source_table: Table, include_primary_key: bool = True):
         """
         Create table in destination database based on source table schema
         
         Args:
             source_table: Source table object to copy schema from
+            include_primary_key: If False, create the table without its primary
+                key so it can be added after a bulk load (see add_primary_key)
         """
-        if self.table_exists():
+        if self._known_to_exist():
             print(f"Table {self.table_name} already exists in destination")
             return
         
+        with self.engine.begin() as conn:
+            created = self._create_if_missing(conn, source_table, include_primary_key)
+        
+        self.invalidate()
+        self._exists = True
+        if created:
+            print(f"✓ Table {self.table_name} created successfully")
+        else:
+            print(f"Table {self.table_name} already exists in destination")
+    
+    @classmethod
+    def create_many(cls, engine: Engine, source_tables: Dict[str, Table],
+                    include_primary_key: bool = True) -> Dict[str, 'TableManager']:
+        """
+        Create several tables from source schemas with one DDL script
+        
+        Existing tables are found with one catalog query per schema and left
+        alone. PostgreSQL and SQL Server run the CREATE statements as one
+        batch; other drivers take one statement per call, so those run in
+        turn inside a single transaction.
+        
+        Args:
+            engine: SQLAlchemy engine for the destination
+            source_tables: Dictionary of destination table name to source table
+            include_primary_key: If False, create the tables without primary keys
+        
+        Returns:
+            Dictionary of destination table name to TableManager
+        """
+        managers = {name: cls(engine, name) for name in source_tables}
+        inspector = inspect(engine)
+        names_by_schema: Dict[Optional[str], Set[str]] = {}
+        
+        missing = []
+        for manager in managers.values():
+            if manager.schema not in names_by_schema:
+                names_by_schema[manager.schema] = set(inspector.get_table_names(schema=manager.schema))
+            manager._table_names_cache[manager.schema] = names_by_schema[manager.schema]
+            
+            if manager.table_exists():
+                print(f"Table {manager.table_name} already exists in destination")
+            else:
+                missing.append(manager)
+        
+        if not missing:
+            return managers
+        
+        names = ", ".join(m.table_name for m in missing)
         try:
-            # Create new table with same schema
-            new_table = Table(
-                self.table_name_only,
-                self.metadata,
-                *[self._clone_column(col) for col in source_table.columns],
-                schema=self.schema,
-                # Note: Primary keys and indexes are included in column definitions
-                # Foreign keys are intentionally not copied to avoid dependency issues
-            )
+            new_tables = [
+                m._build_table(source_tables[m.table_name], include_primary_key) for m in missing
+            ]
             
-            # Create table in database
-            self.metadata.create_all(self.engine)
-            print(f"✓ Table {self.table_name} created successfully")
+            statements = []
+            needs_events = []
+            for table in new_tables:
+                table_statements = cls._ddl_statements(table, engine.dialect)
+                if table_statements is None:
+                    needs_events.append(table)
+                else:
+                    statements.extend(table_statements)
             
+            with engine.begin() as conn:
+                for table in needs_events:
+                    # checkfirst also covers the table's ENUM types, which may
+                    # already exist or be shared with an earlier table
+                    table.create(conn, checkfirst=True)
+                
+                if statements and engine.dialect.name in ('postgresql', 'mssql'):
+                    conn.exec_driver_sql(";\n".join(statements), execution_options=NO_PARAMETERS)
+                else:
+                    for statement in statements:
+                        conn.exec_driver_sql(statement, execution_options=NO_PARAMETERS)
         except Exception as e:
-            raise RuntimeError(f"Failed to create table {self.table_name}: {str(e)}")
+            raise RuntimeError(f"Failed to create tables {names}: {str(e)}")
+        
+        for manager, table in zip(missing, new_tables):
+            manager.invalidate()
+            manager._table = table
+            manager._exists = True
+        
+        print(f"✓ Tables {names} created successfully")
+        return managers
+    
+    def _known_to_exist(self) -> bool:
+        """Check the cached catalog information only (no SQL)"""
+        return self._exists or self.table_name_only in self._table_names_cache.get(self.schema, ())
     
-    def _clone_column(self, column: Column) -> Column:
+    def _known_missing(self) -> bool:
+        """Check whether the cached table list rules the table out (no SQL)"""
+        names = self._table_names_cache.get(self.schema)
+        return not self._exists and names is not None and self.table_name_only not in names
+    
+    def _create_if_missing(self, conn, source_table: Table, include_primary_key: bool = True) -> bool:
+        """
+        Create the table on an open connection unless it already exists
+        
+        The single has_table probe replaces both the table_exists() check
+        and the one create_all would make.
+        
+        Args:
+            conn: Connection to the destination database
+            source_table: Source table object to copy schema from
+            include_primary_key: Whether to keep the primary key
+        
+        Returns:
+            True if the table was created
+        """
+        if conn.dialect.has_table(conn, self.table_name_only, schema=self.schema):
+            return False
+        
+        new_table = self._build_table(source_table, include_primary_key)
+        # checkfirst also skips ENUM types that already exist
+        new_table.create(conn, checkfirst=True)
+        self._table = new_table
+        return True
+    
+    @staticmethod
+    def _ddl_statements(table: Table, dialect) -> Optional[List[str]]:
+        """
+        Render the CREATE TABLE and CREATE INDEX statements for a table
+        
+        Used by create_many to send several tables as one script. Native
+        PostgreSQL ENUM columns need create()'s DDL events, which create
+        their types before the table, so those tables are left out. Dialects
+        without inline comments (PostgreSQL, Oracle, SQL Server) get the
+        COMMENT statements create() would have emitted.
+        
+        Args:
+            table: Table to render
+            dialect: Destination dialect
+        
+        Returns:
+            DDL strings, or None if the table must go through table.create()
+        """
+        if dialect.name == 'postgresql' and any(
+            isinstance(col.type, Enum) and col.type.native_enum for col in table.columns
+        ):
+            return None
+        
+        statements = [str(CreateTable(table).compile(dialect=dialect))]
+        statements.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes)
+        
+        if dialect.supports_comments and not dialect.inline_comments:
+            if table.comment is not None:
+                statements.append(str(SetTableComment(table).compile(dialect=dialect)))
+            statements.extend(
+                str(SetColumnComment(col).compile(dialect=dialect))
+                for col in table.columns if col.comment is not None
+            )
+        return statements
+    
+    def _build_table(self, source_table: Table, include_primary_key: bool = True) -> Table:
+        """
+        Define this table in its MetaData with the source table's columns
+        
+        Args:
+            source_table: Source table object to copy schema from
+            include_primary_key: Whether to keep the primary key
+        
+        Returns:
+            New (not yet created) Table object
+        """
+        # Server-side default SQL is only portable within one dialect
+        same_dialect = source_table.info.get('dialect') == self._dialect
+        
+        return Table(
+            self.table_name_only,
+            self._get_metadata(),
+            *[self._clone_column(col, include_primary_key, same_dialect) for col in source_table.columns],
+            schema=self.schema,
+            comment=source_table.comment,
+            # Note: Primary keys and indexes are included in column definitions
+            # Foreign keys are intentionally not copied to avoid dependency issues
+        )
+    
+    def _clone_column(self, column: Column, include_primary_key: bool = True,
+                      keep_server_defaults: bool = False) -> Column:
         """
         Clone a column definition (without foreign key constraints)
         
+        Column._copy() carries over comments and dialect options as well.
+        Computed and identity columns become plain columns, so migrated values
+        can be inserted as they are.
+        
         Args:
             column: Source column
+            include_primary_key: Whether to keep the primary key flag
+            keep_server_defaults: Whether to keep server defaults (only safe
+                when source and destination share a dialect)
             
         Returns:
             Cloned column
         """
-        # Create new column with same properties but no foreign keys
-        return Column(
-            column.name,
-            column.type,
-            primary_key=column.primary_key,
-            nullable=column.nullable,
-            default=column.default,
-            autoincrement=column.autoincrement,
-        )
+        new_column = column._copy()
+        new_column.foreign_keys = set()
+        
+        new_column.primary_key = column.primary_key and include_primary_key
+        if not new_column.primary_key:
+            new_column.autoincrement = 'auto'
+        
+        # A nextval() default points at the source's sequence, which the
+        # destination doesn't have; SERIAL is generated from autoincrement
+        default_sql = str(getattr(new_column.server_default, 'arg', ''))
+        if (not keep_server_defaults or new_column.computed is not None
+                or new_column.identity is not None or 'nextval(' in default_sql):
+            new_column.server_default = None
+            new_column.server_onupdate = None
+        new_column.computed = None
+        new_column.identity = None
+        
+        return new_column
+    
+    @_rerr("Failed to add primary key to {self.table_name}")
+    def add_primary_key(self, column_names: Sequence[str]):
+        """
+        Add a primary key constraint to an existing table
+        
+        Args:
+            column_names: Primary key column names, in key order
+        """
+        columns = ", ".join(_quote(self.engine.dialect, None, name) for name in column_names)
+        
+        with self.engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {self._quoted} ADD PRIMARY KEY ({columns})"))
+        print(f"✓ Primary key ({', '.join(column_names)}) added to {self.table_name}")
     
+    def begin_bulk_load(self, conn):
+        """
+        Relax trigger and constraint checks on a connection before a bulk load
+        
+        Args:
+            conn: Connection that will perform the inserts
+        """
+        db_name = self._dialect
+        
+        if db_name == 'postgresql':
+            # Skips triggers and foreign key checks (requires superuser)
+            conn.execute(text("SET session_replication_role = replica"))
+        elif db_name == 'mssql':
+            conn.execute(text(f"ALTER TABLE {self._quoted} NOCHECK CONSTRAINT ALL"))
+            conn.execute(
+                text("EXEC sp_tableoption :name, 'table lock on bulk load', 'ON'"),
+                {'name': self.table_name}
+            )
+        elif db_name == 'mysql':
+            conn.execute(text("SET unique_checks = 0, foreign_key_checks = 0"))
+        
+        conn.commit()
+    
+    def end_bulk_load(self, conn):
+        """
+        Restore the checks relaxed by begin_bulk_load
+        
+        Args:
+            conn: Connection that performed the inserts
+        """
+        db_name = self._dialect
+        
+        if db_name == 'postgresql':
+            conn.execute(text("SET session_replication_role = origin"))
+        elif db_name == 'mssql':
+            conn.execute(text(f"ALTER TABLE {self._quoted} WITH CHECK CHECK CONSTRAINT ALL"))
+            conn.execute(
+                text("EXEC sp_tableoption :name, 'table lock on bulk load', 'OFF'"),
+                {'name': self.table_name}
+            )
+        elif db_name == 'mysql':
+            conn.execute(text("SET unique_checks = 1, foreign_key_checks = 1"))
+        
+        conn.commit()
+    
+    @_rerr("Failed to truncate table {self.table_name}")
     def truncate_table(self):
-        """Truncate (empty) the table"""
-        if not self.table_exists():
-            return
+        """
+        Truncate (empty) the table and reset its identity/sequence counters
         
+        Does nothing if the table doesn't exist.
+        """
         try:
-            with self.engine.connect() as conn:
-                # Different databases have different truncate syntax
-                db_name = self.engine.dialect.name
+            with self.engine.begin() as conn:
+                self._truncate(conn)
+            
+            print(f"✓ Table {self.table_name} truncated")
                 
-                if db_name == 'sqlite':
-                    # SQLite doesn't support TRUNCATE
-                    conn.execute(text(f"DELETE FROM {self.table_name}"))
+        except Exception:
+            if not self.table_exists():
+                return
+            raise
+    
+    @classmethod
+    def truncate_many(cls, engine: Engine, managers: Sequence['TableManager']):
+        """
+        Truncate several existing tables in one transaction
+        
+        PostgreSQL takes them all in a single TRUNCATE statement. Other
+        dialects only truncate one table per statement, so each table is
+        emptied in turn on the same connection.
+        
+        Args:
+            engine: SQLAlchemy engine all the tables live in
+            managers: Managers for the tables to truncate
+        """
+        if not managers:
+            return
+        
+        names = ", ".join(m.table_name for m in managers)
+        try:
+            with engine.begin() as conn:
+                if engine.dialect.name == 'postgresql':
+                    quoted = ", ".join(m._quoted for m in managers)
+                    conn.exec_driver_sql(
+                        f"TRUNCATE TABLE {quoted} RESTART IDENTITY CASCADE",
+                        execution_options=NO_PARAMETERS
+                    )
                 else:
-                    conn.execute(text(f"TRUNCATE TABLE {self.table_name}"))
-                
-                conn.commit()
-                print(f"✓ Table {self.table_name} truncated")
-                
+                    for manager in managers:
+                        manager._truncate(conn)
+            
+            print(f"✓ Tables {names} truncated")
+            
         except Exception as e:
-            raise RuntimeError(f"Failed to truncate table {self.table_name}: {str(e)}")
+            raise RuntimeError(f"Failed to truncate tables {names}: {str(e)}")
+    
+    def _truncate(self, conn):
+        """
+        Empty the table on an open connection (the caller commits)
+        
+        Args:
+            conn: Connection to the table's database
+        """
+        db_name = self._dialect
+        
+        if db_name == 'mssql':
+            self._truncate_mssql(conn)
+            return
+        
+        conn.exec_driver_sql(self._truncate_sql, execution_options=NO_PARAMETERS)
+        
+        if db_name == 'sqlite':
+            has_sequence = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+            )).first()
+            if has_sequence:
+                conn.execute(
+                    text("DELETE FROM sqlite_sequence WHERE name = :name"),
+                    {'name': self.table_name_only}
+                )
+    
+    def _truncate_mssql(self, conn):
+        """
+        Truncate on SQL Server, falling back to DELETE when foreign keys
+        reference the table (TRUNCATE is refused there)
+        
+        Args:
+            conn: Connection to the table's database
+        """
+        try:
+            # A savepoint keeps the outer transaction usable if TRUNCATE fails
+            with conn.begin_nested():
+                conn.exec_driver_sql(self._truncate_sql, execution_options=NO_PARAMETERS)
+            return
+        except DBAPIError:
+            pass
+        
+        # DBCC CHECKIDENT takes the table name as a string literal
+        literal = self._quoted.replace("'", "''")
+        conn.execute(text(f"DELETE FROM {self._quoted}"))
+        conn.execute(text(
+            f"IF OBJECTPROPERTY(OBJECT_ID('{literal}'), 'TableHasIdentity') = 1 "
+            f"DBCC CHECKIDENT ('{literal}', RESEED, 0)"
+        ))
+
+
+class AsyncTableManager:
+    """
+    TableManager for an AsyncEngine, so checks on several tables can run
+    concurrently under asyncio.gather
+    """
+    
+    __slots__ = ('engine', 'table_name', '_manager')
+    
+    def __init__(self, engine: AsyncEngine, table_name: str, assume_exists: bool = False):
+        """
+        Initialize async table manager
+        
+        Args:
+            engine: SQLAlchemy async engine
+            table_name: Name of the table (can include schema like 'schema.table')
+            assume_exists: If True, skip the catalog lookup in table_exists()
+        """
+        self.engine = engine
+        self.table_name = table_name
+        
+        # Sync manager over the same pool; its connection-level helpers do
+        # the actual work inside run_sync
+        self._manager = TableManager(engine.sync_engine, table_name, assume_exists)
+    
+    async def table_exists(self) -> bool:
+        """
+        Check if table exists in database
+        
+        Returns:
+            True if table exists, False otherwise
+        """
+        manager = self._manager
+        if manager._exists:
+            return True
+        
+        if manager.schema not in manager._table_names_cache:
+            async with self.engine.connect() as conn:
+                names = await conn.run_sync(
+                    lambda sync_conn: inspect(sync_conn).get_table_names(schema=manager.schema)
+                )
+            manager._table_names_cache[manager.schema] = set(names)
+        
+        return manager.table_exists()
+    
+    @_rerr("Failed to reflect table {self.table_name}")
+    async def get_table_object(self) -> Optional[Table]:
+        """
+        Get SQLAlchemy Table object by reflecting from database
+        
+        Returns:
+            Table object or None if table doesn't exist
+        """
+        manager = self._manager
+        if manager._table is not None:
+            return manager._table
+        
+        if manager._known_missing():
+            return None
+        
+        try:
+            async with self.engine.connect() as conn:
+                manager._table = await conn.run_sync(
+                    lambda sync_conn: Table(
+                        manager.table_name_only,
+                        manager._get_metadata(),
+                        schema=manager.schema,
+                        autoload_with=sync_conn,
+                        info={'dialect': manager._dialect}
+                    )
+                )
+            manager._exists = True
+            return manager._table
+        except NoSuchTableError:
+            return None
+    
+    @_rerr("Failed to get row count for {self.table_name}")
+    async def get_row_count(self, exact: bool = True) -> int:
+        """
+        Get the number of rows in the table
+        
+        Args:
+            exact: If False, read the statistics catalog estimate (see
+                TableManager.get_row_count)
+        
+        Returns:
+            Row count (0 if the table doesn't exist)
+        """
+        try:
+            async with self.engine.connect() as conn:
+                if not exact:
+                    count = await conn.run_sync(self._manager._estimate_row_count)
+                    if count is not None:
+                        return count
+                
+                result = await conn.execute(self._manager._count_stmt)
+                return result.scalar()
+        except Exception:
+            if not await self.table_exists():
+                return 0
+            raise
+    
+    @_rerr("Failed to create table {self.table_name}")
+    async def create_table_from_source(self, source_table: Table, include_primary_key: bool = True):
+        """
+        Create table in destination database based on source table schema
+        
+        Args:
+            source_table: Source table object to copy schema from
+            include_primary_key: If False, create the table without its primary key
+        """
+        manager = self._manager
+        if manager._known_to_exist():
+            print(f"Table {self.table_name} already exists in destination")
+            return
+        
+        async with self.engine.begin() as conn:
+            created = await conn.run_sync(
+                manager._create_if_missing, source_table, include_primary_key
+            )
+        
+        manager.invalidate()
+        manager._exists = True
+        if created:
+            print(f"✓ Table {self.table_name} created successfully")
+        else:
+            print(f"Table {self.table_name} already exists in destination")
+    
+    @_rerr("Failed to truncate table {self.table_name}")
+    async def truncate_table(self):
+        """
+        Truncate (empty) the table and reset its identity/sequence counters
+        
+        Does nothing if the table doesn't exist.
+        """
+        try:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(self._manager._truncate)
+            
+            print(f"✓ Table {self.table_name} truncated")
+        
+        except Exception:
+            if not await self.table_exists():
+                return
+            raise